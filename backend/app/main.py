@@ -1,8 +1,11 @@
+import os
 from typing import Any
 
+import anyio
 from fastapi import FastAPI, File, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 from .schemas import (
     DuplicateRemovalRequest,
@@ -21,10 +24,11 @@ from .services.excel_service import (
     process_uploaded_file,
     remove_rows,
     revalidate,
+    rows_to_columns,
     session_store,
 )
 
-app = FastAPI(title="Excel Checker API", version="0.1.0")
+app = FastAPI(title="Excel Checker API", version="0.1.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -35,11 +39,36 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def configure_threadpool() -> None:
+    # Pandas work runs in the default threadpool; size it to the machine.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = min(32, (os.cpu_count() or 4) * 4)
+
+
+@app.on_event("shutdown")
+async def drop_sessions() -> None:
+    # Deletes the spooled workbook behind every live session.
+    session_store.clear()
+
+
+def _stream_workbook(path: str, chunk_size: int = 64 * 1024):
+    # The workbook lives in a scratch file; stream it out in chunks and
+    # unlink it once the response finishes (or the client disconnects).
+    try:
+        with open(path, "rb") as handle:
+            while chunk := handle.read(chunk_size):
+                yield chunk
+    finally:
+        os.unlink(path)
+
+
 @app.post("/api/upload", response_model=UploadResponse)
 async def upload_excel(file: UploadFile = File(...)) -> Any:
-    file_bytes = await file.read()
     try:
-        session, payload = process_uploaded_file(file_bytes, file.filename)
+        # UploadFile already spools the body to disk; hand the file object
+        # straight to the parser instead of copying the bytes into memory.
+        session, payload = await run_in_threadpool(process_uploaded_file, file.file, file.filename)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     session_id = session_store.create_session(session)
@@ -53,9 +82,8 @@ async def validate_excel(payload: ValidateRequest) -> Any:
         session = session_store.get(payload.sessionId)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Session not found") from exc
-    rows = [row.dict() for row in payload.rows]
-    columns_payload = [column.dict() for column in payload.columns]
-    result = revalidate(session, rows, payload.columnTypes, columns_payload)
+    columns_payload = [column.model_dump() for column in payload.columns]
+    result = await run_in_threadpool(revalidate, session, payload.rows, payload.columnTypes, columns_payload)
     session_store.update(payload.sessionId, session)
     result["sessionId"] = payload.sessionId
     return result
@@ -67,23 +95,30 @@ async def remove_duplicates(request: DuplicateRemovalRequest) -> Any:
         session = session_store.get(request.sessionId)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Session not found") from exc
-    updated_rows = remove_rows(session, request.rowIds)
-    result = revalidate(session, updated_rows, session.overrides)
+    result = await run_in_threadpool(_remove_rows_and_revalidate, session, request.rowIds)
     session_store.update(request.sessionId, session)
     result["sessionId"] = request.sessionId
     return result
 
 
+def _remove_rows_and_revalidate(session: Any, row_ids: Any) -> Any:
+    # One critical section: a concurrent validate must not see the session
+    # between the removal and the follow-up revalidation.
+    with session.lock:
+        updated_rows = remove_rows(session, row_ids)
+        return revalidate(session, updated_rows, session.overrides)
+
+
 @app.get("/api/report/{session_id}")
 async def download_report(session_id: str) -> StreamingResponse:
     try:
         session = session_store.get(session_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Session not found") from exc
-    report_bytes = generate_error_report(session)
+    report_path = await run_in_threadpool(generate_error_report, session)
     filename = session.original_filename.rsplit(".", 1)[0] + "_report.xlsx"
     return StreamingResponse(
-        iter([report_bytes]),
+        _stream_workbook(report_path),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
@@ -93,13 +128,14 @@ async def download_report(session_id: str) -> StreamingResponse:
 async def export_sheet(request: ExportRequest) -> StreamingResponse:
     if not request.rows:
         raise HTTPException(status_code=400, detail="No data provided for export.")
-    export_bytes = export_rows_to_excel(
-        [row.dict() for row in request.rows],
-        [column.dict() for column in request.columns],
+    export_path = await run_in_threadpool(
+        export_rows_to_excel,
+        request.rows,
+        [column.model_dump() for column in request.columns],
     )
     filename = (request.sessionId or "edited").split(".")[0] + "_edited.xlsx"
     return StreamingResponse(
-        iter([export_bytes]),
+        _stream_workbook(export_path),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
@@ -109,13 +145,14 @@ async def export_sheet(request: ExportRequest) -> StreamingResponse:
 async def download_report_from_payload(request: ReportRequest) -> StreamingResponse:
     if not request.rows or not request.errors:
         raise HTTPException(status_code=400, detail="Rows and errors are required.")
-    report_bytes = generate_error_report_from_rows(
-        [row.dict() for row in request.rows],
-        [error.dict() for error in request.errors],
+    report_path = await run_in_threadpool(
+        generate_error_report_from_rows,
+        request.rows,
+        request.errors,
     )
     filename = "validation_report.xlsx"
     return StreamingResponse(
-        iter([report_bytes]),
+        _stream_workbook(report_path),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
@@ -130,33 +167,38 @@ async def switch_sheet(request: SheetRequest) -> Any:
     if request.sheetName not in session.sheet_names:
         raise HTTPException(status_code=400, detail="Sheet not found in workbook.")
     try:
-        (
-            rows,
-            columns,
-            detected_types,
-            column_info,
-            errors,
-            duplicate_groups,
-        ) = parse_sheet(session.workbook_bytes, request.sheetName)
+        payload = await run_in_threadpool(_switch_session_sheet, session, request.sheetName)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    session.rows = rows
-    session.columns = columns
-    session.detected_types = detected_types
-    session.column_info = column_info
-    session.errors = errors
-    session.duplicate_groups = duplicate_groups
-    session.sheet_name = request.sheetName
-    session.overrides = {}
     session_store.update(request.sessionId, session)
-    payload = {
+    payload["sessionId"] = request.sessionId
+    return payload
+
+
+def _switch_session_sheet(session: Any, sheet_name: str) -> Any:
+    (
+        rows,
+        columns,
+        detected_types,
+        column_info,
+        errors,
+        duplicate_groups,
+    ) = parse_sheet(session.workbook_path, sheet_name, file_hash=session.workbook_hash or None)
+    with session.lock:
+        session.columns_data, session.row_ids = rows_to_columns(rows, columns)
+        session.columns = columns
+        session.detected_types = detected_types
+        session.column_info = column_info
+        session.errors = errors
+        session.duplicate_groups = duplicate_groups
+        session.sheet_name = sheet_name
+        session.overrides = {}
+    return {
         "columns": column_info,
         "rows": rows,
         "errors": errors,
         "duplicateGroups": duplicate_groups,
-        "sheetName": request.sheetName,
+        "sheetName": sheet_name,
         "sheetNames": session.sheet_names,
-        "sessionId": request.sessionId,
     }
-    return payload
 
@@ -35,21 +35,23 @@ class UploadResponse(BaseModel):
 
 class ValidateRequest(BaseModel):
     sessionId: str
-    rows: List[RowPayload]
+    # Raw dicts on purpose: building a RowPayload per row costs a full
+    # traversal of the sheet and the values are Any regardless.
+    rows: List[Dict[str, Any]]
     columnTypes: Dict[str, str] = Field(default_factory=dict)
     columns: List[ColumnInfo] = Field(default_factory=list)
 
 
 class ExportRequest(BaseModel):
     sessionId: Optional[str] = None
-    rows: List[RowPayload] = Field(default_factory=list)
+    rows: List[Dict[str, Any]] = Field(default_factory=list)
     columns: List[ColumnInfo] = Field(default_factory=list)
 
 
 class ReportRequest(BaseModel):
-    rows: List[RowPayload] = Field(default_factory=list)
+    rows: List[Dict[str, Any]] = Field(default_factory=list)
     columns: List[ColumnInfo] = Field(default_factory=list)
-    errors: List[CellError] = Field(default_factory=list)
+    errors: List[Dict[str, Any]] = Field(default_factory=list)
 
 
 class SheetRequest(BaseModel):
@@ -1,22 +1,74 @@
 from __future__ import annotations
 
+import hashlib
 import math
+import os
+import pickle
+import secrets
+import sys
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from io import BytesIO
-from threading import Lock
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-from uuid import uuid4
+from threading import Lock, RLock
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from openpyxl.styles import PatternFill
+import xlsxwriter
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover - ciso8601 is optional
+    ciso8601 = None
+
+try:
+    from python_calamine import CalamineError
+except ImportError:  # pragma: no cover - calamine is optional
+    CalamineError = None
+
+# Unreadable workbooks surface as ValueError from pandas' own engines but as
+# CalamineError from the forced calamine path; both must map to the same 400.
+_WORKBOOK_READ_ERRORS = (ValueError,) if CalamineError is None else (ValueError, CalamineError)
 
 TYPE_PRIORITY = ["integer", "float", "boolean", "date", "string"]
 ALLOWED_TYPES = set(TYPE_PRIORITY)
+BOOL_TOKENS = {"true", "false", "yes", "no", "0", "1"}
+_MAX_VALIDATION_WORKERS = min(8, os.cpu_count() or 1)
+_PARALLEL_ROW_THRESHOLD = 512
+_CODEGEN_ROW_THRESHOLD = 256
+
+
+def _int_valid_kernel(coerced: np.ndarray, null_mask: np.ndarray) -> np.ndarray:
+    out = np.empty(coerced.shape[0], np.bool_)
+    for i in range(coerced.shape[0]):
+        out[i] = null_mask[i] or (np.isfinite(coerced[i]) and coerced[i] == np.floor(coerced[i]))
+    return out
+
+
+def _float_valid_kernel(coerced: np.ndarray, null_mask: np.ndarray) -> np.ndarray:
+    out = np.empty(coerced.shape[0], np.bool_)
+    for i in range(coerced.shape[0]):
+        out[i] = null_mask[i] or not np.isnan(coerced[i])
+    return out
+
+
+if njit is not None:
+    _int_valid_kernel = njit(cache=True)(_int_valid_kernel)
+    _float_valid_kernel = njit(cache=True)(_float_valid_kernel)
 
 
 @dataclass
 class SessionData:
-    rows: List[Dict[str, Any]]
+    columns_data: Dict[str, List[Any]]
+    row_ids: List[int]
     columns: List[str]
     detected_types: Dict[str, str]
     column_info: List[Dict[str, Any]]
@@ -24,59 +76,131 @@ class SessionData:
     duplicate_groups: List[List[int]] = field(default_factory=list)
     original_filename: str = "uploaded.xlsx"
     overrides: Dict[str, str] = field(default_factory=dict)
-    workbook_bytes: bytes = b""
+    workbook_path: str = ""
+    workbook_hash: bytes = b""
     sheet_name: str = ""
     sheet_names: List[str] = field(default_factory=list)
+    # Guards the multi-field mutations in revalidate/remove_rows: endpoints
+    # run those in the threadpool, so two requests on one session are
+    # genuinely concurrent. Reentrant so remove-then-revalidate can hold it
+    # across both steps.
+    lock: Any = field(default_factory=RLock, repr=False, compare=False)
+
+
+SESSION_STORE_MAX = 64
 
 
 class SessionStore:
-    def __init__(self) -> None:
-        self._sessions: Dict[str, SessionData] = {}
+    # Single-key dict operations are atomic under the GIL, so reads need
+    # no lock; create/update mutate multiple things and take one. The store
+    # is capped so spooled workbooks can't pile up in the temp directory on
+    # a long-running server: the oldest session (and its workbook file) is
+    # dropped once the cap is hit.
+    def __init__(self, max_sessions: int = SESSION_STORE_MAX) -> None:
+        self._sessions: "OrderedDict[str, SessionData]" = OrderedDict()
+        self._max_sessions = max_sessions
         self._lock = Lock()
 
     def create_session(self, session: SessionData) -> str:
-        session_id = str(uuid4())
+        session_id = secrets.token_urlsafe(16)
         with self._lock:
             self._sessions[session_id] = session
+            while len(self._sessions) > self._max_sessions:
+                _, evicted = self._sessions.popitem(last=False)
+                _discard_workbook(evicted.workbook_path)
         return session_id
 
     def get(self, session_id: str) -> SessionData:
-        with self._lock:
-            if session_id not in self._sessions:
-                raise KeyError("Session not found")
-            return self._sessions[session_id]
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise KeyError("Session not found")
+        return session
 
     def update(self, session_id: str, session: SessionData) -> None:
         with self._lock:
-            if session_id not in self._sessions:
+            previous = self._sessions.get(session_id)
+            if previous is None:
                 raise KeyError("Session not found")
+            if previous.workbook_path and previous.workbook_path != session.workbook_path:
+                _discard_workbook(previous.workbook_path)
             self._sessions[session_id] = session
 
+    def clear(self) -> None:
+        with self._lock:
+            while self._sessions:
+                _, evicted = self._sessions.popitem(last=False)
+                _discard_workbook(evicted.workbook_path)
+
+
+def _discard_workbook(path: str) -> None:
+    if not path:
+        return
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
 
 session_store = SessionStore()
 
+PARSE_CACHE_MAX = 32
+_parse_cache: "OrderedDict[Tuple[bytes, str], Tuple[Any, ...]]" = OrderedDict()
+_parse_cache_lock = Lock()
 
-def process_uploaded_file(file_bytes: bytes, filename: str) -> Tuple[SessionData, Dict[str, Any]]:
-    excel_file = pd.ExcelFile(BytesIO(file_bytes))
-    sheet_names = excel_file.sheet_names or ["Sheet1"]
-    sheet_name = sheet_names[0]
-    (
-        rows,
-        columns,
-        detected_types,
-        column_info,
-        errors,
-        duplicate_groups,
-    ) = parse_sheet(file_bytes, sheet_name)
+COLUMN_CACHE_MAX = 256
+_detect_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_detect_cache_lock = Lock()
+_column_error_cache: "OrderedDict[Tuple[bytes, bytes, str, str], List[Dict[str, Any]]]" = OrderedDict()
+_column_error_cache_lock = Lock()
+
+
+def _hash_values(values: List[Any]) -> bytes:
+    try:
+        payload = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        # Unpicklable content just skips the cache.
+        return b""
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def process_uploaded_file(file_obj: Union[bytes, BinaryIO], filename: str) -> Tuple[SessionData, Dict[str, Any]]:
+    if isinstance(file_obj, (bytes, bytearray)):
+        file_obj = BytesIO(file_obj)
+    workbook_path, workbook_hash = _spool_workbook(file_obj)
+    try:
+        try:
+            excel_file = pd.ExcelFile(workbook_path, engine="calamine")
+        except ImportError:
+            excel_file = pd.ExcelFile(workbook_path)
+        except _WORKBOOK_READ_ERRORS as exc:
+            raise ValueError("Unable to read the uploaded Excel file.") from exc
+        sheet_names = excel_file.sheet_names or ["Sheet1"]
+        sheet_name = sheet_names[0]
+        (
+            rows,
+            columns,
+            detected_types,
+            column_info,
+            errors,
+            duplicate_groups,
+        ) = parse_sheet(workbook_path, sheet_name, file_hash=workbook_hash)
+    except Exception:
+        # The spool never made it into a session, so nothing else will
+        # ever delete it.
+        _discard_workbook(workbook_path)
+        raise
+    columns_data, row_ids = rows_to_columns(rows, columns)
     session = SessionData(
-        rows=rows,
+        columns_data=columns_data,
+        row_ids=row_ids,
         columns=columns,
         detected_types=detected_types,
         column_info=column_info,
         errors=errors,
         duplicate_groups=duplicate_groups,
         original_filename=filename or "uploaded.xlsx",
-        workbook_bytes=file_bytes,
+        workbook_path=workbook_path,
+        workbook_hash=workbook_hash,
         sheet_name=sheet_name,
         sheet_names=sheet_names,
     )
@@ -92,8 +216,9 @@ def process_uploaded_file(file_bytes: bytes, filename: str) -> Tuple[SessionData
 
 
 def parse_sheet(
-    file_bytes: bytes,
+    source: Union[bytes, str],
     sheet_name: Optional[str],
+    file_hash: Optional[bytes] = None,
 ) -> Tuple[
     List[Dict[str, Any]],
     List[str],
@@ -102,9 +227,19 @@ def parse_sheet(
     List[Dict[str, Any]],
     List[List[int]],
 ]:
-    rows, columns = read_excel_into_rows(file_bytes, sheet_name=sheet_name)
-    detected_types = detect_types(rows, columns)
-    errors, duplicate_groups = validate_rows(rows, detected_types)
+    if file_hash is None:
+        file_hash = _hash_workbook(source)
+    cache_key = (file_hash, sheet_name or "")
+    with _parse_cache_lock:
+        cached = _parse_cache.get(cache_key)
+        if cached is not None:
+            _parse_cache.move_to_end(cache_key)
+            return _copy_parsed_sheet(cached)
+    rows, columns = read_excel_into_rows(source, sheet_name=sheet_name)
+    columns_data, row_ids = rows_to_columns(rows, columns)
+    detected_types = detect_types(columns_data)
+    errors = _validate_columns(columns_data, row_ids, detected_types)
+    duplicate_groups = _identify_duplicate_groups(columns_data, row_ids, columns)
     column_info = [
         {
             "name": column,
@@ -114,7 +249,55 @@ def parse_sheet(
         }
         for column in columns
     ]
-    return rows, columns, detected_types, column_info, errors, duplicate_groups
+    parsed = (rows, columns, detected_types, column_info, errors, duplicate_groups)
+    with _parse_cache_lock:
+        _parse_cache[cache_key] = parsed
+        _parse_cache.move_to_end(cache_key)
+        while len(_parse_cache) > PARSE_CACHE_MAX:
+            _parse_cache.popitem(last=False)
+    return _copy_parsed_sheet(parsed)
+
+
+def _spool_workbook(file_obj: BinaryIO) -> Tuple[str, bytes]:
+    digest = hashlib.blake2b(digest_size=16)
+    descriptor, path = tempfile.mkstemp(prefix="excel-checker-", suffix=".xlsx")
+    with os.fdopen(descriptor, "wb") as target:
+        file_obj.seek(0)
+        while chunk := file_obj.read(1024 * 1024):
+            digest.update(chunk)
+            target.write(chunk)
+    return path, digest.digest()
+
+
+def _hash_workbook(source: Union[bytes, str]) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(source, (bytes, bytearray)):
+        digest.update(source)
+    else:
+        with open(source, "rb") as handle:
+            while chunk := handle.read(1024 * 1024):
+                digest.update(chunk)
+    return digest.digest()
+
+
+def _copy_parsed_sheet(parsed: Tuple[Any, ...]) -> Tuple[
+    List[Dict[str, Any]],
+    List[str],
+    Dict[str, str],
+    List[Dict[str, Any]],
+    List[Dict[str, Any]],
+    List[List[int]],
+]:
+    # Callers mutate rows/column_info in place, so hand out fresh containers.
+    rows, columns, detected_types, column_info, errors, duplicate_groups = parsed
+    return (
+        [{"rowId": row["rowId"], "values": dict(row["values"])} for row in rows],
+        list(columns),
+        dict(detected_types),
+        [dict(column) for column in column_info],
+        [dict(error) for error in errors],
+        [list(group) for group in duplicate_groups],
+    )
 
 
 def revalidate(
@@ -123,167 +306,239 @@ def revalidate(
     overrides: Dict[str, str],
     column_info_payload: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
-    if column_info_payload:
-        session.column_info = [
-            {
-                "name": column["name"],
-                "detectedType": column.get("detectedType") or session.detected_types.get(column["name"], "string"),
-                "overrideType": column.get("overrideType"),
-                "nullable": column.get("nullable", True),
-            }
-            for column in column_info_payload
-        ]
-        session.columns = [column["name"] for column in session.column_info]
-    coerced_overrides = {
-        column: _normalize_type(value) for column, value in overrides.items() if column in session.columns
-    }
-    expected_types: Dict[str, str] = {}
-    for column in session.column_info:
-        column_name = column["name"]
-        override_type = coerced_overrides.get(column_name) or column.get("overrideType")
-        if override_type:
-            column["overrideType"] = override_type
-        detected_type = column.get("detectedType") or session.detected_types.get(column_name, "string")
-        expected_types[column_name] = override_type or detected_type or "string"
-    errors, duplicate_groups = validate_rows(rows, expected_types)
-    session.rows = rows
-    session.overrides = coerced_overrides
-    session.errors = errors
-    session.duplicate_groups = duplicate_groups
-    session.detected_types = expected_types.copy()
-    payload = {
-        "columns": session.column_info,
-        "rows": rows,
-        "errors": errors,
-        "duplicateGroups": duplicate_groups,
-        "sheetName": session.sheet_name,
-        "sheetNames": session.sheet_names,
-    }
-    return payload
+    with session.lock:
+        if column_info_payload:
+            session.column_info = [
+                {
+                    "name": sys.intern(column["name"]),
+                    "detectedType": column.get("detectedType") or session.detected_types.get(column["name"], "string"),
+                    "overrideType": column.get("overrideType"),
+                    "nullable": column.get("nullable", True),
+                }
+                for column in column_info_payload
+            ]
+            session.columns = [column["name"] for column in session.column_info]
+        coerced_overrides = {
+            column: _normalize_type(value) for column, value in overrides.items() if column in session.columns
+        }
+        expected_types: Dict[str, str] = {}
+        for column in session.column_info:
+            column_name = column["name"]
+            override_type = coerced_overrides.get(column_name) or column.get("overrideType")
+            if override_type:
+                column["overrideType"] = override_type
+            detected_type = column.get("detectedType") or session.detected_types.get(column_name, "string")
+            expected_types[column_name] = override_type or detected_type or "string"
+        columns_data, row_ids = rows_to_columns(rows, list(expected_types.keys()))
+        errors = _revalidate_changed_cells(session, columns_data, row_ids, expected_types)
+        duplicate_groups = _identify_duplicate_groups(columns_data, row_ids, list(expected_types.keys()))
+        session.columns_data = columns_data
+        session.row_ids = row_ids
+        session.overrides = coerced_overrides
+        session.errors = errors
+        session.duplicate_groups = duplicate_groups
+        session.detected_types = expected_types.copy()
+        payload = {
+            "columns": session.column_info,
+            "rows": rows,
+            "errors": errors,
+            "duplicateGroups": duplicate_groups,
+            "sheetName": session.sheet_name,
+            "sheetNames": session.sheet_names,
+        }
+        return payload
 
 
 def remove_rows(session: SessionData, row_ids: Iterable[int]) -> List[Dict[str, Any]]:
-    removal_set = set(row_ids)
-    filtered_rows = [row for row in session.rows if row["rowId"] not in removal_set]
-    # Reassign rowId to keep ordering predictable
-    for idx, row in enumerate(filtered_rows):
-        row["rowId"] = idx
-    session.rows = filtered_rows
-    return filtered_rows
+    with session.lock:
+        removal_set = set(row_ids)
+        kept = [position for position, row_id in enumerate(session.row_ids) if row_id not in removal_set]
+        id_map = {session.row_ids[position]: new_id for new_id, position in enumerate(kept)}
+        session.columns_data = {
+            column: [values[position] for position in kept] for column, values in session.columns_data.items()
+        }
+        # Reassign rowId to keep ordering predictable
+        session.row_ids = list(range(len(kept)))
+        # Renumber surviving errors so incremental revalidation can reuse them.
+        session.errors = [
+            dict(error, rowId=id_map[error["rowId"]])
+            for error in session.errors
+            if error["rowId"] in id_map
+        ]
+        return columns_to_rows(session.columns_data, session.row_ids)
 
 
-def generate_error_report(session: SessionData) -> bytes:
-    return generate_error_report_from_rows(session.rows, session.errors)
+def generate_error_report(session: SessionData) -> str:
+    with session.lock:
+        rows = columns_to_rows(session.columns_data, session.row_ids)
+        errors = [dict(error) for error in session.errors]
+    return generate_error_report_from_rows(rows, errors)
 
 
 def generate_error_report_from_rows(
     rows: List[Dict[str, Any]],
     errors: List[Dict[str, Any]],
-) -> bytes:
-    df = pd.DataFrame([row["values"] for row in rows])
-    error_map = {(error["rowId"], error["column"]): error for error in errors}
-    buffer = BytesIO()
-    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name="Data")
-        workbook = writer.book
-        worksheet = writer.sheets["Data"]
-        red_fill = PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid")
-        for (row_id, column), error in error_map.items():
-            if column not in df.columns:
-                continue
-            col_idx = df.columns.get_loc(column) + 1
-            cell = worksheet.cell(row=row_id + 2, column=col_idx)
-            cell.fill = red_fill
-        summary = pd.DataFrame(
-            [
-                {
-                    "Row": error["rowId"] + 2,
-                    "Column": error["column"],
-                    "Expected Type": error["expectedType"],
-                    "Value": error["actualValue"],
-                    "Message": error["message"],
-                }
-                for error in errors
-            ]
-        )
-        if not summary.empty:
-            summary.to_excel(writer, index=False, sheet_name="Errors")
-    buffer.seek(0)
-    return buffer.getvalue()
+) -> str:
+    """Build the report workbook on disk and return its path.
+
+    The caller streams the file out and unlinks it afterwards, so the
+    workbook never has to exist in memory as one blob.
+    """
+    columns = _ordered_column_union(rows)
+    error_cells = {(error["rowId"], error["column"]) for error in errors}
+    path = _workbook_scratch_path()
+    # constant_memory assembles through a temp file; combining it with
+    # in_memory silently turns constant_memory off, so the workbook target
+    # has to be a real path for the memory bound to hold.
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+    red_format = workbook.add_format({"bg_color": "#FFC7CE"})
+    worksheet = workbook.add_worksheet("Data")
+    # constant_memory flushes each row as it is written, so the error fill
+    # has to be applied on write instead of patching cells afterwards.
+    _write_header(worksheet, columns)
+    for position, row in enumerate(rows, start=1):
+        row_id = row["rowId"]
+        values = row["values"]
+        for col_idx, column in enumerate(columns):
+            cell_format = red_format if (row_id, column) in error_cells else None
+            worksheet.write(position, col_idx, values.get(column), cell_format)
+    if errors:
+        summary_sheet = workbook.add_worksheet("Errors")
+        _write_header(summary_sheet, ["Row", "Column", "Expected Type", "Value", "Message"])
+        for position, error in enumerate(errors, start=1):
+            summary_sheet.write(position, 0, error["rowId"] + 2)
+            summary_sheet.write(position, 1, error["column"])
+            summary_sheet.write(position, 2, error["expectedType"])
+            summary_sheet.write(position, 3, error["actualValue"])
+            summary_sheet.write(position, 4, error["message"])
+    workbook.close()
+    return path
+
+
+def export_rows_to_excel(rows: List[Dict[str, Any]], columns: List[Dict[str, Any]]) -> str:
+    ordered_columns = [column["name"] for column in columns] if columns else _ordered_column_union(rows)
+    path = _workbook_scratch_path()
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+    worksheet = workbook.add_worksheet("Edited Data")
+    _write_header(worksheet, ordered_columns)
+    for position, row in enumerate(rows, start=1):
+        record = row["values"] if "values" in row else row
+        for col_idx, column in enumerate(ordered_columns):
+            worksheet.write(position, col_idx, record.get(column))
+    workbook.close()
+    return path
+
 
+def _workbook_scratch_path() -> str:
+    descriptor, path = tempfile.mkstemp(prefix="excel-checker-out-", suffix=".xlsx")
+    os.close(descriptor)
+    return path
 
-def export_rows_to_excel(rows: List[Dict[str, Any]], columns: List[Dict[str, Any]]) -> bytes:
-    ordered_columns = [column["name"] for column in columns] if columns else []
-    data = []
+
+def _ordered_column_union(rows: List[Dict[str, Any]]) -> List[str]:
+    columns: List[str] = []
+    seen = set()
     for row in rows:
-        record = row["values"] if "values" in row else row
-        if ordered_columns:
-            record = {column: record.get(column) for column in ordered_columns}
-        data.append(record)
-    df = pd.DataFrame(data)
-    if ordered_columns:
-        missing = [column for column in ordered_columns if column not in df.columns]
-        for column in missing:
-            df[column] = None
-        df = df[ordered_columns]
-    buffer = BytesIO()
-    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name="Edited Data")
-    buffer.seek(0)
-    return buffer.getvalue()
+        for column in row["values"]:
+            if column not in seen:
+                seen.add(column)
+                columns.append(column)
+    return columns
+
+
+def _write_header(worksheet: "xlsxwriter.worksheet.Worksheet", columns: List[str]) -> None:
+    for col_idx, column in enumerate(columns):
+        worksheet.write(0, col_idx, column)
 
 
 def read_excel_into_rows(
-    file_bytes: bytes,
+    source: Union[bytes, str],
     sheet_name: Optional[str] = None,
 ) -> Tuple[List[Dict[str, Any]], List[str]]:
+    if isinstance(source, (bytes, bytearray)):
+        source = BytesIO(source)
     try:
-        df = pd.read_excel(BytesIO(file_bytes), sheet_name=sheet_name)
-    except ValueError as exc:
+        try:
+            df = pd.read_excel(source, sheet_name=sheet_name, engine="calamine")
+        except ImportError:
+            if hasattr(source, "seek"):
+                source.seek(0)
+            df = pd.read_excel(source, sheet_name=sheet_name)
+    except _WORKBOOK_READ_ERRORS as exc:
         raise ValueError("Unable to read the uploaded Excel file.") from exc
-    original_columns = list(df.columns)
-    columns = [str(column) for column in original_columns]
-    na_mask = df.isna()
-    rows: List[Dict[str, Any]] = []
-    for idx in range(len(df)):
-        row_series = df.iloc[idx]
-        mask_series = na_mask.iloc[idx]
-        normalized: Dict[str, Any] = {}
-        for col_name, original in zip(columns, original_columns):
-            if bool(mask_series[original]):
-                normalized[col_name] = ""
-            else:
-                normalized[col_name] = _normalize_cell_value(row_series[original])
-        rows.append({"rowId": idx, "values": normalized})
+    # Interned names mean every row dict shares one key object per column.
+    columns = [sys.intern(str(column)) for column in df.columns]
+    df = df.copy()
+    df.columns = columns
+    for column in df.select_dtypes(include=["datetime64[ns]"]).columns:
+        df[column] = df[column].dt.strftime("%Y-%m-%dT%H:%M:%S")
+    df = df.where(df.notna(), "")
+    records = df.to_dict(orient="records")
+    rows = [{"rowId": idx, "values": record} for idx, record in enumerate(records)]
     return rows, columns
 
 
-def detect_types(rows: List[Dict[str, Any]], columns: List[str]) -> Dict[str, str]:
-    detected: Dict[str, str] = {}
-    for column in columns:
-        values = [row["values"].get(column) for row in rows]
-        detected[column] = detect_column_type(values)
-    return detected
+def rows_to_columns(
+    rows: List[Dict[str, Any]],
+    columns: List[str],
+) -> Tuple[Dict[str, List[Any]], List[int]]:
+    row_ids = [row["rowId"] for row in rows]
+    columns_data = {column: [row["values"].get(column) for row in rows] for column in columns}
+    return columns_data, row_ids
+
+
+def columns_to_rows(columns_data: Dict[str, List[Any]], row_ids: List[int]) -> List[Dict[str, Any]]:
+    columns = list(columns_data.keys())
+    return [
+        {"rowId": row_id, "values": {column: columns_data[column][position] for column in columns}}
+        for position, row_id in enumerate(row_ids)
+    ]
+
+
+def detect_types(columns_data: Dict[str, List[Any]]) -> Dict[str, str]:
+    return {column: detect_column_type(values) for column, values in columns_data.items()}
 
 
 def detect_column_type(values: Iterable[Any]) -> str:
+    values = list(values) if not isinstance(values, (list, pd.Series)) else values
+    content_hash = _hash_values(list(values))
+    if content_hash:
+        with _detect_cache_lock:
+            cached = _detect_cache.get(content_hash)
+            if cached is not None:
+                _detect_cache.move_to_end(content_hash)
+                return cached
+    detected = _detect_column_type(values)
+    if content_hash:
+        with _detect_cache_lock:
+            _detect_cache[content_hash] = detected
+            _detect_cache.move_to_end(content_hash)
+            while len(_detect_cache) > COLUMN_CACHE_MAX:
+                _detect_cache.popitem(last=False)
+    return detected
+
+
+def _detect_column_type(values: Iterable[Any]) -> str:
+    series = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+    candidates = series[~_null_mask(series)]
+    if candidates.empty:
+        return "string"
+    is_bool = candidates.map(lambda value: isinstance(value, bool))
+    coerced = pd.to_numeric(candidates.where(~is_bool), errors="coerce")
+    numeric = coerced.notna()
+    integer_mask = numeric & (coerced % 1 == 0)
+    bool_mask = is_bool | (~numeric & candidates.astype(str).str.strip().str.lower().isin(BOOL_TOKENS))
     scores = {type_name: 0 for type_name in TYPE_PRIORITY}
-    for value in values:
-        if _is_null(value):
-            continue
-        if _looks_like_int(value):
-            scores["integer"] += 1
-            continue
-        if _looks_like_float(value):
-            scores["float"] += 1
-            continue
-        if _looks_like_bool(value):
-            scores["boolean"] += 1
-            continue
-        if _looks_like_date(value):
-            scores["date"] += 1
-            continue
-        scores["string"] += 1
+    scores["integer"] = int(integer_mask.sum())
+    scores["float"] = int(numeric.sum()) - scores["integer"]
+    scores["boolean"] = int(bool_mask.sum())
+    remaining = candidates[~numeric & ~bool_mask]
+    if not remaining.empty:
+        is_date = remaining.map(lambda value: isinstance(value, pd.Timestamp))
+        is_str = remaining.map(lambda value: isinstance(value, str))
+        parsed = pd.to_datetime(remaining.where(is_str), errors="coerce", format="mixed")
+        scores["date"] = int((is_date | parsed.notna()).sum())
+    scores["string"] = len(remaining) - scores["date"]
     best_type = max(TYPE_PRIORITY, key=lambda type_name: (scores[type_name], -TYPE_PRIORITY.index(type_name)))
     if scores[best_type] == 0:
         return "string"
@@ -291,47 +546,233 @@ def detect_column_type(values: Iterable[Any]) -> str:
 
 
 def validate_rows(rows: List[Dict[str, Any]], expected_types: Dict[str, str]) -> Tuple[List[Dict[str, Any]], List[List[int]]]:
+    columns = list(expected_types.keys())
+    columns_data, row_ids = rows_to_columns(rows, columns)
+    errors = _validate_columns(columns_data, row_ids, expected_types)
+    duplicate_groups = _identify_duplicate_groups(columns_data, row_ids, columns)
+    return errors, duplicate_groups
+
+
+def _revalidate_changed_cells(
+    session: SessionData,
+    columns_data: Dict[str, List[Any]],
+    row_ids: List[int],
+    expected_types: Dict[str, str],
+) -> List[Dict[str, Any]]:
+    # Diff the incoming data against what the session already validated and
+    # only re-check cells that actually changed; columns whose expected type
+    # changed (or whose shape no longer lines up) get a full pass.
+    if row_ids != session.row_ids:
+        return _validate_columns(columns_data, row_ids, expected_types)
+    previous_errors: Dict[str, List[Dict[str, Any]]] = {}
+    for error in session.errors:
+        previous_errors.setdefault(error["column"], []).append(error)
+    column_order = {column: position for position, column in enumerate(expected_types)}
     errors: List[Dict[str, Any]] = []
-    for row in rows:
-        for column, expected_type in expected_types.items():
-            value = row["values"].get(column)
+    stale_columns: Dict[str, str] = {}
+    for column, expected_type in expected_types.items():
+        values = columns_data.get(column)
+        if values is None:
+            continue
+        old_values = session.columns_data.get(column)
+        if (
+            old_values is None
+            or len(old_values) != len(values)
+            or session.detected_types.get(column) != expected_type
+        ):
+            stale_columns[column] = expected_type
+            continue
+        changed = [position for position in range(len(values)) if not _same_cell(values[position], old_values[position])]
+        if len(changed) * 2 > len(values):
+            # Mostly new data; the vectorized pass is cheaper than cell diffs.
+            stale_columns[column] = expected_type
+            continue
+        changed_ids = {row_ids[position] for position in changed}
+        errors.extend(
+            dict(error) for error in previous_errors.get(column, []) if error["rowId"] not in changed_ids
+        )
+        for position in changed:
+            value = values[position]
             if not _is_valid(value, expected_type):
                 errors.append(
                     {
-                        "rowId": row["rowId"],
+                        "rowId": row_ids[position],
                         "column": column,
                         "expectedType": expected_type,
                         "actualValue": value,
                         "message": f"Expected {expected_type}, received '{value}'",
                     }
                 )
-    duplicate_groups = identify_duplicates(rows, list(expected_types.keys()))
-    return errors, duplicate_groups
+    if stale_columns:
+        errors.extend(_validate_columns(columns_data, row_ids, stale_columns))
+    errors.sort(key=lambda error: (error["rowId"], column_order[error["column"]]))
+    return errors
 
 
-def identify_duplicates(rows: List[Dict[str, Any]], columns: List[str]) -> List[List[int]]:
-    seen: Dict[Tuple[Any, ...], List[int]] = {}
-    for row in rows:
-        key = tuple(_coerce_duplicate_value(row["values"].get(column)) for column in columns)
-        seen.setdefault(key, []).append(row["rowId"])
-    return [group for group in seen.values() if len(group) > 1]
+def _same_cell(new: Any, old: Any) -> bool:
+    if new is old:
+        return True
+    if type(new) is not type(old):
+        return False
+    try:
+        return bool(new == old)
+    except Exception:
+        return False
 
 
-def _normalize_cell_value(value: Any) -> Any:
-    if hasattr(value, "item"):
+def _validate_columns(
+    columns_data: Dict[str, List[Any]],
+    row_ids: List[int],
+    expected_types: Dict[str, str],
+) -> List[Dict[str, Any]]:
+    if not row_ids:
+        return []
+    index = pd.Index(row_ids)
+    column_order = {column: position for position, column in enumerate(expected_types)}
+    work = [
+        (column, columns_data[column], expected_type)
+        for column, expected_type in expected_types.items()
+        if column in columns_data
+    ]
+    if len(row_ids) < _CODEGEN_ROW_THRESHOLD:
+        # Small batches: a compiled per-sheet row loop beats the cost of
+        # building a Series per column.
+        checker = _specialized_validator(tuple((column, expected_type) for column, _, expected_type in work))
+        errors: List[Dict[str, Any]] = []
+        checker(row_ids, [values for _, values, _ in work], errors)
+        errors.sort(key=lambda error: (error["rowId"], column_order[error["column"]]))
+        return errors
+    row_ids_hash = _hash_values(row_ids)
+    if len(work) > 1 and len(row_ids) >= _PARALLEL_ROW_THRESHOLD and _MAX_VALIDATION_WORKERS > 1:
+        # The coercion/parsing hot loops release the GIL, so columns can
+        # be checked concurrently.
+        with ThreadPoolExecutor(max_workers=min(_MAX_VALIDATION_WORKERS, len(work))) as executor:
+            batches = executor.map(lambda args: _validate_column_cached(index, row_ids_hash, *args), work)
+            errors = [error for batch in batches for error in batch]
+    else:
+        errors = [error for args in work for error in _validate_column_cached(index, row_ids_hash, *args)]
+    errors.sort(key=lambda error: (error["rowId"], column_order[error["column"]]))
+    return errors
+
+
+def _validate_column_cached(
+    index: pd.Index,
+    row_ids_hash: bytes,
+    column: str,
+    values: List[Any],
+    expected_type: str,
+) -> List[Dict[str, Any]]:
+    values_hash = _hash_values(values) if row_ids_hash else b""
+    cache_key = (row_ids_hash, values_hash, column, expected_type)
+    if values_hash:
+        with _column_error_cache_lock:
+            cached = _column_error_cache.get(cache_key)
+            if cached is not None:
+                _column_error_cache.move_to_end(cache_key)
+                return [dict(error) for error in cached]
+    errors = _validate_column(index, column, values, expected_type)
+    if values_hash:
+        with _column_error_cache_lock:
+            _column_error_cache[cache_key] = [dict(error) for error in errors]
+            _column_error_cache.move_to_end(cache_key)
+            while len(_column_error_cache) > COLUMN_CACHE_MAX:
+                _column_error_cache.popitem(last=False)
+    return errors
+
+
+def _validate_column(
+    index: pd.Index,
+    column: str,
+    values: List[Any],
+    expected_type: str,
+) -> List[Dict[str, Any]]:
+    series = pd.Series(values, index=index, dtype=object)
+    invalid = ~_valid_mask(series, expected_type)
+    if not invalid.any():
+        return []
+    return [
+        {
+            "rowId": row_id,
+            "column": column,
+            "expectedType": expected_type,
+            "actualValue": value,
+            "message": f"Expected {expected_type}, received '{value}'",
+        }
+        for row_id, value in series[invalid].items()
+    ]
+
+
+def _null_mask(series: pd.Series) -> pd.Series:
+    return series.isna() | (series.astype(str).str.strip() == "")
+
+
+def _valid_mask(series: pd.Series, expected_type: str) -> pd.Series:
+    if expected_type not in ALLOWED_TYPES or expected_type == "string":
+        return pd.Series(True, index=series.index)
+    null_mask = _null_mask(series)
+    is_bool = series.map(lambda value: isinstance(value, bool))
+    if expected_type == "integer":
+        coerced = pd.to_numeric(series.where(~is_bool), errors="coerce")
+        if njit is not None:
+            floats = coerced.to_numpy(dtype=np.float64, na_value=np.nan)
+            valid = _int_valid_kernel(floats, null_mask.to_numpy(dtype=np.bool_))
+            return pd.Series(valid, index=series.index)
+        return null_mask | (coerced.notna() & (coerced % 1 == 0))
+    if expected_type == "float":
+        coerced = pd.to_numeric(series.where(~is_bool), errors="coerce")
+        if njit is not None:
+            floats = coerced.to_numpy(dtype=np.float64, na_value=np.nan)
+            valid = _float_valid_kernel(floats, null_mask.to_numpy(dtype=np.bool_))
+            return pd.Series(valid, index=series.index)
+        return null_mask | coerced.notna()
+    if expected_type == "boolean":
+        coerced = pd.to_numeric(series.where(~is_bool), errors="coerce")
+        lowered = series.astype(str).str.strip().str.lower()
+        return null_mask | is_bool | lowered.isin(BOOL_TOKENS) | coerced.isin((0, 1))
+    is_date = series.map(lambda value: isinstance(value, pd.Timestamp))
+    is_str = series.map(lambda value: isinstance(value, str))
+    parsed = pd.to_datetime(series.where(is_str), errors="coerce", format="mixed")
+    return null_mask | is_date | parsed.notna()
+
+
+def identify_duplicates(rows: List[Dict[str, Any]], columns: List[str]) -> List[List[int]]:
+    columns_data, row_ids = rows_to_columns(rows, columns)
+    return _identify_duplicate_groups(columns_data, row_ids, columns)
+
+
+def _identify_duplicate_groups(
+    columns_data: Dict[str, List[Any]],
+    row_ids: List[int],
+    columns: List[str],
+) -> List[List[int]]:
+    if not row_ids:
+        return []
+    if not columns:
+        return [list(row_ids)] if len(row_ids) > 1 else []
+    df = pd.DataFrame(
+        {
+            column: pd.Series(columns_data.get(column, [None] * len(row_ids)), dtype=object)
+            for column in columns
+        }
+    )
+    for column in columns:
+        series = df[column]
         try:
-            value = value.item()
-        except Exception:
-            pass
-    if isinstance(value, pd.Timestamp):
-        return value.isoformat()
-    if isinstance(value, float) and math.isnan(value):
-        return ""
-    return value
+            # .str returns NaN for non-strings, so fillna restores the originals.
+            df[column] = series.str.strip().str.lower().fillna(series)
+        except AttributeError:
+            # The accessor refuses columns without any strings; nothing to normalize.
+            continue
+    groups = df.groupby(columns, dropna=False, sort=False).indices
+    return [
+        [row_ids[position] for position in positions]
+        for positions in groups.values()
+        if len(positions) > 1
+    ]
 
 
 def _is_null(value: Any) -> bool:
-    if value is None:
+    if value is None or value is pd.NaT:
         return True
     if isinstance(value, str):
         return value.strip() == ""
@@ -340,43 +781,47 @@ def _is_null(value: Any) -> bool:
     return False
 
 
-def _looks_like_int(value: Any) -> bool:
-    if isinstance(value, bool):
-        return False
-    if isinstance(value, int):
-        return True
-    if isinstance(value, float):
-        return value.is_integer()
-    if isinstance(value, str):
-        value = value.strip()
-        if value.startswith("-"):
-            return value[1:].isdigit()
-        return value.isdigit()
-    return False
-
+def _coerce_number(value: Any) -> Optional[float]:
+    """Scalar twin of ``pd.to_numeric(errors="coerce")``.
 
-def _looks_like_float(value: Any) -> bool:
+    Returns the coerced float, or None where to_numeric would produce NaN.
+    The scalar and vectorized validators both go through this definition of
+    "numeric", so batch size never changes which cells are flagged. Unlike
+    bare float(), to_numeric rejects underscore separators and non-ASCII
+    digits, so those are filtered before the float() fallback.
+    """
     if isinstance(value, bool):
-        return False
-    if isinstance(value, (int, float)):
-        return True
+        return None
     if isinstance(value, str):
+        if "_" in value or not value.isascii():
+            return None
         try:
-            float(value)
-            return True
+            return float(value)
         except ValueError:
-            return False
-    return False
+            return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _looks_like_int(value: Any) -> bool:
+    coerced = _coerce_number(value)
+    return coerced is not None and math.isfinite(coerced) and coerced == math.floor(coerced)
+
+
+def _looks_like_float(value: Any) -> bool:
+    coerced = _coerce_number(value)
+    return coerced is not None and not math.isnan(coerced)
 
 
 def _looks_like_bool(value: Any) -> bool:
     if isinstance(value, bool):
         return True
-    if isinstance(value, str):
-        return value.strip().lower() in {"true", "false", "yes", "no", "0", "1"}
-    if isinstance(value, (int, float)):
-        return value in {0, 1}
-    return False
+    if isinstance(value, str) and value.strip().lower() in BOOL_TOKENS:
+        return True
+    coerced = _coerce_number(value)
+    return coerced is not None and coerced in (0.0, 1.0)
 
 
 def _looks_like_date(value: Any) -> bool:
@@ -385,35 +830,66 @@ def _looks_like_date(value: Any) -> bool:
     if isinstance(value, str):
         if not value.strip():
             return False
+        if ciso8601 is not None:
+            # Round-tripped cells are ISO-8601 strings; ciso8601 parses
+            # those far faster than the pandas scalar path.
+            try:
+                ciso8601.parse_datetime(value)
+                return True
+            except ValueError:
+                pass
         parsed = pd.to_datetime(value, errors="coerce")
         return parsed is not pd.NaT and not pd.isna(parsed)
     return False
 
 
-def _is_valid(value: Any, expected_type: str) -> bool:
-    if expected_type not in ALLOWED_TYPES:
-        expected_type = "string"
-    if _is_null(value):
-        return True
-    if expected_type == "string":
-        return True
-    if expected_type == "integer":
-        return _looks_like_int(value)
-    if expected_type == "float":
-        return _looks_like_float(value)
-    if expected_type == "boolean":
-        return _looks_like_bool(value)
-    if expected_type == "date":
-        return _looks_like_date(value)
-    return True
+_VALIDATORS = {
+    "integer": _looks_like_int,
+    "float": _looks_like_float,
+    "boolean": _looks_like_bool,
+    "date": _looks_like_date,
+    "string": lambda value: True,
+}
 
 
-def _coerce_duplicate_value(value: Any) -> Any:
-    if isinstance(value, str):
-        return value.strip().lower()
-    if isinstance(value, float) and math.isnan(value):
-        return None
-    return value
+def _is_valid(value: Any, expected_type: str) -> bool:
+    validator = _VALIDATORS.get(expected_type, _VALIDATORS["string"])
+    return _is_null(value) or validator(value)
+
+
+@lru_cache(maxsize=64)
+def _specialized_validator(type_items: Tuple[Tuple[str, str], ...]):
+    """Compile a row-loop validator specialized to one column/type layout.
+
+    The generated function inlines the column names, predicates, and error
+    templates, so the hot loop has no dict lookups or type dispatch. Layouts
+    repeat across revalidations, hence the lru_cache.
+    """
+    namespace: Dict[str, Any] = {"_is_null": _is_null}
+    checked = [
+        (position, column, expected_type)
+        for position, (column, expected_type) in enumerate(type_items)
+        if expected_type in _VALIDATORS and expected_type != "string"
+    ]
+    lines = ["def _check(row_ids, columns, out):"]
+    if not checked:
+        lines.append("    pass")
+    else:
+        for position, column, expected_type in checked:
+            lines.append(f"    col_{position} = columns[{position}]")
+            namespace[f"_check_{position}"] = _VALIDATORS[expected_type]
+        lines.append("    for i in range(len(row_ids)):")
+        lines.append("        rid = row_ids[i]")
+        for position, column, expected_type in checked:
+            lines.append(f"        v = col_{position}[i]")
+            lines.append(f"        if not (_is_null(v) or _check_{position}(v)):")
+            lines.append(
+                "            out.append({'rowId': rid, 'column': %r, 'expectedType': %r, "
+                "'actualValue': v, 'message': f\"Expected %s, received '{v}'\"})"
+                % (column, expected_type, expected_type)
+            )
+    exec(compile("\n".join(lines), "<column-validator>", "exec"), namespace)
+    return namespace["_check"]
 
 
 def _normalize_type(value: Optional[str]) -> Optional[str]:
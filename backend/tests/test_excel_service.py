@@ -1,3 +1,5 @@
+from copy import deepcopy
+from io import BytesIO
 from pathlib import Path
 import sys
 
@@ -5,12 +7,33 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
 
+import pandas as pd  # noqa: E402
+import pytest  # noqa: E402
+
 from app.services.excel_service import (  # noqa: E402
+    _discard_workbook,
+    _is_valid,
+    _valid_mask,
     detect_column_type,
     identify_duplicates,
+    process_uploaded_file,
+    remove_rows,
+    revalidate,
     validate_rows,
 )
 
+# Values where the scalar predicates and the pandas coercions could
+# plausibly disagree; both validator paths must flag the same cells.
+TRICKY_VALUES = [
+    "5", "5.0", "+5", "-5", " 5 ", "5.2", ".5", "5.", "1e3", "1e0",
+    "inf", "-inf", "Infinity", "nan", "1_000", "0x10", "5,0", "abc",
+    "", "  ", "true", "FALSE ", "yes", "no", "0", "1", "0.0", "2",
+    "2023-01-05", "2023-01-05T10:00:00", "not a date",
+    5, -3, 5.0, 5.2, 0, 1, 2, 0.0, 1.0,
+    float("nan"), float("inf"), True, False, None,
+    pd.Timestamp("2023-01-05"), pd.NaT,
+]
+
 
 def test_detect_column_type_prefers_integer_when_majority_numeric():
     values = [1, "2", "03", None, ""]
@@ -35,3 +58,95 @@ def test_identify_duplicates_groups_matching_rows():
     groups = identify_duplicates(rows, ["A", "B"])
     assert groups == [[0, 1]]
 
+
+def test_scalar_and_vectorized_validators_agree():
+    series = pd.Series(TRICKY_VALUES, dtype=object)
+    for expected_type in ["integer", "float", "boolean", "date"]:
+        vectorized = _valid_mask(series, expected_type).tolist()
+        scalar = [_is_valid(value, expected_type) for value in TRICKY_VALUES]
+        assert vectorized == scalar, expected_type
+
+
+def test_validation_results_do_not_depend_on_batch_size():
+    # Small sheets take the codegen row loop, large sheets the vectorized
+    # column pass; crossing the threshold must not change which cells fail.
+    for expected_type in ["integer", "float", "boolean", "date"]:
+        small_rows = [
+            {"rowId": idx, "values": {"Col": value}} for idx, value in enumerate(TRICKY_VALUES)
+        ]
+        small_errors, _ = validate_rows(small_rows, {"Col": expected_type})
+        small_flagged = {error["rowId"] for error in small_errors}
+
+        repeats = 600 // len(TRICKY_VALUES) + 1
+        large_values = (TRICKY_VALUES * repeats)[:600]
+        large_rows = [
+            {"rowId": idx, "values": {"Col": value}} for idx, value in enumerate(large_values)
+        ]
+        large_errors, _ = validate_rows(large_rows, {"Col": expected_type})
+        large_flagged = {error["rowId"] % len(TRICKY_VALUES) for error in large_errors}
+
+        assert small_flagged == large_flagged, expected_type
+
+
+def test_unreadable_upload_raises_value_error():
+    # CalamineError from the forced calamine engine must not leak past the
+    # ValueError contract the endpoints translate into a 400.
+    with pytest.raises(ValueError):
+        process_uploaded_file(b"not an excel file", "bad.xlsx")
+
+
+@pytest.fixture
+def upload_column():
+    # These sessions never enter the session store, so their spooled
+    # workbooks must be unlinked here instead of by store eviction.
+    sessions = []
+
+    def _upload(values):
+        buffer = BytesIO()
+        pd.DataFrame({"A": values}).to_excel(buffer, index=False)
+        session, payload = process_uploaded_file(buffer.getvalue(), "test.xlsx")
+        sessions.append(session)
+        return session, payload
+
+    yield _upload
+    for session in sessions:
+        _discard_workbook(session.workbook_path)
+
+
+def test_revalidate_single_edit_matches_full_validation(upload_column):
+    # The incremental pass only re-checks edited cells; its verdicts must be
+    # indistinguishable from validating the whole sheet from scratch.
+    session, payload = upload_column(["5.0"] * 600)
+    result = revalidate(session, deepcopy(payload["rows"]), {"A": "integer"}, payload["columns"])
+    assert result["errors"] == []
+
+    edited = deepcopy(result["rows"])
+    edited[42]["values"]["A"] = "6.0"
+    edited[43]["values"]["A"] = "abc"
+    incremental = revalidate(session, edited, {"A": "integer"})
+    full, _ = validate_rows(deepcopy(edited), {"A": "integer"})
+    assert incremental["errors"] == full
+    assert [error["rowId"] for error in incremental["errors"]] == [43]
+
+
+def test_revalidate_override_add_and_remove(upload_column):
+    session, payload = upload_column([1, "x", 3])
+    result = revalidate(session, deepcopy(payload["rows"]), {"A": "integer"}, payload["columns"])
+    assert [error["rowId"] for error in result["errors"]] == [1]
+
+    columns = deepcopy(result["columns"])
+    columns[0]["overrideType"] = "string"
+    cleared = revalidate(session, deepcopy(result["rows"]), {}, columns)
+    assert cleared["errors"] == []
+
+
+def test_remove_rows_renumbers_surviving_errors(upload_column):
+    session, payload = upload_column([1, "bad", 3, 3])
+    result = revalidate(session, deepcopy(payload["rows"]), {"A": "integer"}, payload["columns"])
+    assert [error["rowId"] for error in result["errors"]] == [1]
+
+    remaining = remove_rows(session, [0])
+    assert [error["rowId"] for error in session.errors] == [0]
+    revalidated = revalidate(session, remaining, session.overrides)
+    assert [(error["rowId"], error["actualValue"]) for error in revalidated["errors"]] == [(0, "bad")]
+